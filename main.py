@@ -1,12 +1,8 @@
 #!/usr/bin/env python3
 """Entry point for RoundSeq MIDI Sequencer."""
 
-import os
-import sys
-
-# Ensure the package is importable
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
+# Running this script puts its directory on sys.path, so the package is
+# importable without any path manipulation. `python -m roundseq` also works.
 from roundseq.app import run
 
 if __name__ == "__main__":
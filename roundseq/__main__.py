@@ -0,0 +1,5 @@
+"""Allow running RoundSeq with `python -m roundseq`."""
+
+from .app import run
+
+run()
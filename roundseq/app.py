@@ -1,12 +1,20 @@
 """Main Kivy application for RoundSeq."""
 
+import logging
+import os
+
+from .platform import get_platform_name, is_macos, is_raspberry_pi
+
+# Kivy reads this when it is first imported. Release runs can opt out of
+# Kivy's console handler (the log still goes to ~/.kivy/logs); by default it
+# stays on so Kivy output reaches journalctl on the Pi.
+if os.environ.get("ROUNDSEQ_RELEASE") == "1":
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
 from kivy.app import App
-from kivy.core.window import Window
 from kivy.config import Config
 
-from .screens.note_play_screen import NotePlayScreen
 from .services import get_midi_service
-from .platform import get_platform_name, is_raspberry_pi
 from .config import DISPLAY_WIDTH, DISPLAY_HEIGHT, COLORS
 
 
@@ -30,13 +38,19 @@ class RoundSeqApp(App):
         print(f"[RoundSeq] Running on {get_platform_name()}")
         print(f"[RoundSeq] MIDI ports: {self._midi_service.list_ports()}")
 
-        # Create main screen
+        # Create main screen (imported here so the widget tree is only loaded
+        # once the app is actually building its UI)
+        from .screens.note_play_screen import NotePlayScreen
         self._note_screen = NotePlayScreen(midi_service=self._midi_service)
 
         return self._note_screen
 
     def _configure_window(self):
         """Configure the window based on platform."""
+        # Importing Window creates it, so this must not happen before run()
+        # has applied the graphics Config
+        from kivy.core.window import Window
+
         # Set background color
         Window.clearcolor = COLORS["background"]
 
@@ -56,13 +70,35 @@ class RoundSeqApp(App):
 
 def run():
     """Run the application."""
+    # Per-note MIDI logging is DEBUG; keep it off unless asked for (e.g.
+    # ROUNDSEQ_LOG_LEVEL=DEBUG), so the touch/MIDI path skips formatting
+    logger = logging.getLogger("roundseq")
+    level = os.environ.get("ROUNDSEQ_LOG_LEVEL")
+    if level:
+        logger.setLevel(level.upper())
+        # Give the records somewhere to go if nothing else configured logging
+        logging.basicConfig(format="%(message)s")
+    elif logger.level == logging.NOTSET:
+        logger.setLevel(logging.WARNING)
+
     # Pre-configure Kivy before importing other modules
     Config.set("graphics", "width", str(DISPLAY_WIDTH))
     Config.set("graphics", "height", str(DISPLAY_HEIGHT))
     Config.set("graphics", "resizable", "0")
 
-    # Disable multitouch emulation (red dots on right-click)
-    Config.set("input", "mouse", "mouse,multitouch_on_demand")
+    # Only register the input providers each platform actually uses, so the
+    # event loop doesn't poll idle ones every frame
+    if is_raspberry_pi():
+        # Touchscreen is picked up via probesysfs; no mouse attached
+        if Config.has_option("input", "mouse"):
+            Config.remove_option("input", "mouse")
+    else:
+        # Disable multitouch emulation (red dots on right-click)
+        Config.set("input", "mouse", "mouse,multitouch_on_demand")
+        # probesysfs finds nothing on macOS; Linux desktops may still have
+        # a touchscreen it picks up
+        if is_macos() and Config.has_option("input", "%(name)s"):
+            Config.remove_option("input", "%(name)s")
 
     # On Raspberry Pi, use simpler fullscreen mode
     if is_raspberry_pi():
@@ -2,6 +2,15 @@
 from __future__ import annotations
 
 import math
+from array import array
+
+# Conversion factors and trig functions bound at module level so the
+# per-point code avoids math.radians/math.degrees calls and attribute lookups
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+_cos = math.cos
+_sin = math.sin
+_atan2 = math.atan2
 
 
 def normalize_angle(degrees: float) -> float:
@@ -13,7 +22,17 @@ def normalize_angle(degrees: float) -> float:
     Returns:
         Angle normalized to [0, 360)
     """
-    return degrees % 360
+    return _wrap_negative(math.fmod(degrees, 360.0))
+
+
+def _wrap_negative(degrees: float) -> float:
+    """Map an angle in (-360, 360) to [0, 360)."""
+    if degrees < 0.0:
+        degrees += 360.0
+        # A tiny negative angle rounds up to exactly 360 when shifted
+        if degrees == 360.0:
+            return 0.0
+    return degrees
 
 
 def angle_span(start: float, end: float) -> float:
@@ -26,12 +45,8 @@ def angle_span(start: float, end: float) -> float:
     Returns:
         Positive span in degrees (e.g., 345 to 15 = 30)
     """
-    start = normalize_angle(start)
-    end = normalize_angle(end)
-    if end >= start:
-        return end - start
-    else:
-        return (360 - start) + end
+    # A single modulo of the difference; no need to normalize each end
+    return (end - start) % 360.0
 
 
 def angle_contains(angle: float, start: float, end: float) -> bool:
@@ -45,15 +60,11 @@ def angle_contains(angle: float, start: float, end: float) -> bool:
     Returns:
         True if angle is within [start, end], handling wrap-around
     """
-    angle = normalize_angle(angle)
-    start = normalize_angle(start)
-    end = normalize_angle(end)
-
-    if start <= end:
-        return start <= angle <= end
-    else:
-        # Wrap-around case (e.g., 345 to 15)
-        return angle >= start or angle <= end
+    # Measuring both offsets from start covers the wrap-around case
+    # (e.g., 345 to 15) without normalizing each input or branching.
+    # A tiny negative offset rounds up to exactly 360; it is really 0.
+    offset = (angle - start) % 360.0
+    return offset <= (end - start) % 360.0 or offset == 360.0
 
 
 def polar_to_cartesian(cx: float, cy: float, radius: float, angle_deg: float) -> tuple[float, float]:
@@ -68,9 +79,9 @@ def polar_to_cartesian(cx: float, cy: float, radius: float, angle_deg: float) ->
     Returns:
         (x, y) cartesian coordinates
     """
-    angle_rad = math.radians(angle_deg)
-    x = cx + radius * math.cos(angle_rad)
-    y = cy + radius * math.sin(angle_rad)
+    angle_rad = angle_deg * _DEG2RAD
+    x = cx + radius * _cos(angle_rad)
+    y = cy + radius * _sin(angle_rad)
     return (x, y)
 
 
@@ -88,9 +99,26 @@ def cartesian_to_polar(cx: float, cy: float, x: float, y: float) -> tuple[float,
     """
     dx = x - cx
     dy = y - cy
-    distance = math.sqrt(dx * dx + dy * dy)
-    angle_deg = math.degrees(math.atan2(dy, dx))
-    return (distance, normalize_angle(angle_deg))
+    distance = math.hypot(dx, dy)
+    angle_deg = _atan2(dy, dx) * _RAD2DEG
+    return (distance, _wrap_negative(angle_deg))
+
+
+def angle_from_center(cx: float, cy: float, x: float, y: float) -> float:
+    """Get the angle of a point as seen from a center.
+
+    Cheaper than cartesian_to_polar when the distance is not needed.
+
+    Args:
+        cx: Center x coordinate
+        cy: Center y coordinate
+        x: Point x coordinate
+        y: Point y coordinate
+
+    Returns:
+        Angle in degrees, in [0, 360)
+    """
+    return _wrap_negative(_atan2(y - cy, x - cx) * _RAD2DEG)
 
 
 def point_in_circle(x: float, y: float, cx: float, cy: float, radius: float) -> bool:
@@ -148,29 +176,65 @@ def point_in_arc(x: float, y: float, cx: float, cy: float,
     Returns:
         True if point is within the arc sector
     """
+    # Called for every touch event, so the ring and angle checks are
+    # inlined rather than going through point_in_ring/cartesian_to_polar.
+    dx = x - cx
+    dy = y - cy
+    dist_sq = dx * dx + dy * dy
+
     # First check radius bounds (fast rejection)
-    if not point_in_ring(x, y, cx, cy, inner_radius, outer_radius):
+    if not (inner_radius * inner_radius) <= dist_sq <= (outer_radius * outer_radius):
         return False
 
     # Then check angle bounds
-    _, angle = cartesian_to_polar(cx, cy, x, y)
+    angle = angle_from_center(cx, cy, x, y)
     return angle_contains(angle, start_angle, end_angle)
 
 
-def arc_points(cx: float, cy: float, radius: float,
-               start_angle: float, end_angle: float,
-               segments: int = None) -> list[tuple[float, float]]:
-    """Generate points along an arc for rendering.
+def point_in_sector(x: float, y: float, cx: float, cy: float,
+                    inner_radius_sq: float, outer_radius_sq: float,
+                    start_angle: float, span: float) -> bool:
+    """Check if point is inside an arc sector, from precomputed bounds.
+
+    Same test as point_in_arc for callers that check one sector many
+    times and can cache its squared radii and angular span.
 
     Args:
+        x, y: Point coordinates
         cx, cy: Arc center
-        radius: Arc radius
+        inner_radius_sq: Inner radius squared
+        outer_radius_sq: Outer radius squared
+        start_angle: Start angle in degrees
+        span: Angular span in degrees (as from angle_span)
+
+    Returns:
+        True if point is within the arc sector
+    """
+    dx = x - cx
+    dy = y - cy
+    dist_sq = dx * dx + dy * dy
+    if not inner_radius_sq <= dist_sq <= outer_radius_sq:
+        return False
+
+    # atan2's [-180, 180] range needs no normalizing before the modulo
+    offset = (_atan2(dy, dx) * _RAD2DEG - start_angle) % 360.0
+    return offset <= span or offset == 360.0
+
+
+def arc_unit_vectors(start_angle: float, end_angle: float,
+                     segments: int = None) -> list[tuple[float, float]]:
+    """Compute (cos, sin) pairs for evenly spaced angles along an arc.
+
+    Shared by the arc generators so the trig is evaluated once per angle,
+    no matter how many radii are drawn at that angle.
+
+    Args:
         start_angle: Start angle in degrees
         end_angle: End angle in degrees
         segments: Number of segments (auto-calculated if None)
 
     Returns:
-        List of (x, y) points along the arc
+        segments + 1 (cos, sin) pairs from start to end
     """
     span = angle_span(start_angle, end_angle)
 
@@ -178,13 +242,35 @@ def arc_points(cx: float, cy: float, radius: float,
         # Auto-calculate: roughly one segment per 5 degrees, minimum 8
         segments = max(8, int(span / 5))
 
-    points = []
+    start_rad = start_angle * _DEG2RAD
+    step = span * _DEG2RAD / segments
+    cos = _cos
+    sin = _sin
+
+    units = []
     for i in range(segments + 1):
-        t = i / segments
-        angle = start_angle + t * span
-        points.append(polar_to_cartesian(cx, cy, radius, angle))
+        a = start_rad + i * step
+        units.append((cos(a), sin(a)))
+    return units
 
-    return points
+
+def arc_points(cx: float, cy: float, radius: float,
+               start_angle: float, end_angle: float,
+               segments: int = None) -> list[tuple[float, float]]:
+    """Generate points along an arc for rendering.
+
+    Args:
+        cx, cy: Arc center
+        radius: Arc radius
+        start_angle: Start angle in degrees
+        end_angle: End angle in degrees
+        segments: Number of segments (auto-calculated if None)
+
+    Returns:
+        List of (x, y) points along the arc
+    """
+    units = arc_unit_vectors(start_angle, end_angle, segments)
+    return [(cx + radius * c, cy + radius * s) for c, s in units]
 
 
 def arc_sector_points(cx: float, cy: float,
@@ -207,8 +293,72 @@ def arc_sector_points(cx: float, cy: float,
     Returns:
         List of (x, y) points forming the sector outline
     """
-    outer_pts = arc_points(cx, cy, outer_radius, start_angle, end_angle, segments)
-    inner_pts = arc_points(cx, cy, inner_radius, start_angle, end_angle, segments)
+    # Both arcs share the same angles, so evaluate the trig only once
+    units = arc_unit_vectors(start_angle, end_angle, segments)
+    n = len(units)
+    points = [None] * (2 * n)
 
     # Outer arc forward, then inner arc backward to close the shape
-    return outer_pts + list(reversed(inner_pts))
+    for i, (c, s) in enumerate(units):
+        points[i] = (cx + outer_radius * c, cy + outer_radius * s)
+        points[2 * n - 1 - i] = (cx + inner_radius * c, cy + inner_radius * s)
+
+    return points
+
+
+def arc_sector_flat(cx: float, cy: float,
+                    inner_radius: float, outer_radius: float,
+                    start_angle: float, end_angle: float,
+                    segments: int = None) -> array:
+    """Generate a flat sector outline ready for a Kivy vertex buffer.
+
+    Same point order as arc_sector_points, but interleaved as
+    [x0, y0, x1, y1, ...] in a float array, so no intermediate point
+    tuples or lists are built.
+
+    Args:
+        cx, cy: Center coordinates
+        inner_radius: Inner radius
+        outer_radius: Outer radius
+        start_angle: Start angle in degrees
+        end_angle: End angle in degrees
+        segments: Number of segments per arc (auto-calculated if None)
+
+    Returns:
+        array('f') of interleaved x, y coordinates
+    """
+    units = arc_unit_vectors(start_angle, end_angle, segments)
+    return arc_sector_flat_from_units(units, cx, cy, inner_radius, outer_radius)
+
+
+def arc_sector_flat_from_units(units: list[tuple[float, float]],
+                               cx: float, cy: float,
+                               inner_radius: float, outer_radius: float) -> array:
+    """Build arc_sector_flat's outline from precomputed arc_unit_vectors.
+
+    Lets callers that also need the arc points for something else (e.g. a
+    mesh) reuse the same trig.
+
+    Args:
+        units: (cos, sin) pairs from arc_unit_vectors
+        cx, cy: Center coordinates
+        inner_radius: Inner radius
+        outer_radius: Outer radius
+
+    Returns:
+        array('f') of interleaved x, y coordinates
+    """
+    n = len(units)
+    # 2n points, 2 floats each, 4 bytes per float
+    flat = array("f", bytes(16 * n))
+
+    last = 4 * n - 2
+    for i, (c, s) in enumerate(units):
+        j = 2 * i
+        flat[j] = cx + outer_radius * c
+        flat[j + 1] = cy + outer_radius * s
+        k = last - j
+        flat[k] = cx + inner_radius * c
+        flat[k + 1] = cy + inner_radius * s
+
+    return flat
@@ -0,0 +1,161 @@
+"""Static geometry of the circular note layout.
+
+C sits at the top (90 degrees) and notes proceed clockwise, each taking an
+equal slice of the circle. Everything here depends only on config constants,
+so it is computed once at import instead of on every layout pass.
+"""
+from __future__ import annotations
+
+import math
+from typing import NamedTuple
+
+from .geometry import normalize_angle, angle_span
+from .config import (
+    NUM_NOTES,
+    NOTE_NAMES,
+    INNER_RADIUS,
+    OUTER_RADIUS,
+)
+
+# Each note gets an equal slice (30 degrees for 12 notes)
+ANGLE_PER_NOTE = 360 / NUM_NOTES
+
+# Note index (0 = C) by name
+NOTE_INDEX = {name: i for i, name in enumerate(NOTE_NAMES)}
+
+# Center angle of each note's slice in degrees
+NOTE_CENTER_ANGLES = tuple(90 - i * ANGLE_PER_NOTE for i in range(NUM_NOTES))
+
+# Squared ring radii for sqrt-free distance checks
+INNER_RADIUS_SQ = INNER_RADIUS * INNER_RADIUS
+OUTER_RADIUS_SQ = OUTER_RADIUS * OUTER_RADIUS
+
+
+class NoteSector(NamedTuple):
+    """Fixed angular geometry of one note's slice."""
+
+    index: int
+    name: str
+    start_angle: float  # Normalized to [0, 360)
+    end_angle: float  # Normalized to [0, 360)
+    span: float
+
+
+def _build_sectors() -> tuple[NoteSector, ...]:
+    sectors = []
+    half_angle = ANGLE_PER_NOTE / 2
+    for i in range(NUM_NOTES):
+        center_angle = NOTE_CENTER_ANGLES[i]
+        start_angle = normalize_angle(center_angle - half_angle)
+        end_angle = normalize_angle(center_angle + half_angle)
+        sectors.append(NoteSector(
+            index=i,
+            name=NOTE_NAMES[i],
+            start_angle=start_angle,
+            end_angle=end_angle,
+            span=angle_span(start_angle, end_angle),
+        ))
+    return tuple(sectors)
+
+
+NOTE_SECTORS = _build_sectors()
+
+
+# note_index_from_offset hard-codes the 12-slice boundaries; fail loudly
+# rather than hit-test the wrong notes if the note count changes
+if NUM_NOTES != 12:
+    raise ValueError(
+        f"note_index_from_offset supports 12 notes, config has {NUM_NOTES}"
+    )
+
+# Slice boundaries fall at 15, 45 and 75 degrees within each quadrant;
+# tan(75) is 1 / tan(15), and tan(45) is 1
+_TAN_15 = math.tan(math.radians(15))
+
+
+def note_index_from_offset(dx: float, dy: float) -> int:
+    """Get the index of the note whose slice contains direction (dx, dy).
+
+    Specialized for the 12-note layout: picks the slice from the signs of
+    dx/dy and at most three comparisons, with no trig or division. Points
+    exactly on a slice boundary may resolve to either neighbour.
+
+    Args:
+        dx, dy: Offset of the point from the layout center
+
+    Returns:
+        Note index (0 = C)
+    """
+    ax = abs(dx)
+    ay = abs(dy)
+
+    # Slice k of the first quadrant, where slice k is centred on k * 30 degrees
+    if ay <= _TAN_15 * ax:
+        k = 0
+    elif ay <= ax:
+        k = 1
+    elif ay * _TAN_15 <= ax:
+        k = 2
+    else:
+        k = 3
+
+    # Mirror into the actual quadrant
+    if dx < 0:
+        k = 6 - k
+    if dy < 0:
+        k = -k
+
+    # Note i is centred on 90 - i * 30 degrees
+    return (3 - k) % 12
+
+
+class NoteRingHitTester:
+    """Kivy-free note lookup for the ring of note slices.
+
+    Mixed into CircularNoteLayout, and usable on a plain object so the hit
+    logic can be tested without a window. The host provides center_x and
+    center_y, and calls set_ring_radii whenever the ring radii change.
+    """
+
+    _inner_sq: float = INNER_RADIUS_SQ
+    _outer_sq: float = OUTER_RADIUS_SQ
+
+    def set_ring_radii(self, inner_radius: float, outer_radius: float):
+        """Cache the squared ring radii used by hit_test."""
+        self._inner_sq = inner_radius * inner_radius
+        self._outer_sq = outer_radius * outer_radius
+
+    def hit_test(self, x: float, y: float) -> int:
+        """Return the index of the note sector containing (x, y), or -1.
+
+        All sectors share the same ring, so the radius check is done once
+        per point; the slice is then picked without any trig.
+        """
+        dx = x - self.center_x
+        dy = y - self.center_y
+        dist_sq = dx * dx + dy * dy
+        if not self._inner_sq <= dist_sq <= self._outer_sq:
+            return -1
+        return note_index_from_offset(dx, dy)
+
+    def hit_test_many(self, points) -> list[int]:
+        """Return hit_test's result for each (x, y) in points.
+
+        Binds the center, radii and slice lookup once for the whole batch.
+        """
+        cx = self.center_x
+        cy = self.center_y
+        inner_sq = self._inner_sq
+        outer_sq = self._outer_sq
+        index_of = note_index_from_offset
+
+        result = []
+        for x, y in points:
+            dx = x - cx
+            dy = y - cy
+            dist_sq = dx * dx + dy * dy
+            if inner_sq <= dist_sq <= outer_sq:
+                result.append(index_of(dx, dy))
+            else:
+                result.append(-1)
+        return result
@@ -2,10 +2,15 @@
 
 import sys
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def is_raspberry_pi() -> bool:
-    """Detect if running on a Raspberry Pi."""
+    """Detect if running on a Raspberry Pi.
+
+    Cached, since the answer cannot change while the process runs.
+    """
     if sys.platform != "linux":
         return False
 
@@ -17,11 +22,13 @@ def is_raspberry_pi() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def is_macos() -> bool:
     """Detect if running on macOS."""
     return sys.platform == "darwin"
 
 
+@lru_cache(maxsize=1)
 def get_platform_name() -> str:
     """Get human-readable platform name."""
     if is_raspberry_pi():
@@ -64,8 +64,7 @@ class NotePlayScreen(FloatLayout):
     def _on_note_on(self, midi_note: int, note_name: str):
         """Handle note on event."""
         # Update center display
-        full_name = f"{note_name}{self._note_layout.octave}"
-        self._center_display.show_note(full_name)
+        self._center_display.show_note(MidiService.note_name(midi_note))
 
         # Send MIDI
         if self.midi_service:
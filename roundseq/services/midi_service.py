@@ -7,6 +7,13 @@ from typing import Optional
 from ..platform import is_raspberry_pi
 from ..config import DEFAULT_VELOCITY, DEFAULT_CHANNEL, NOTE_NAMES
 
+# Pitch class index (into NOTE_NAMES) and octave for every MIDI note (0-127)
+_NAME_IDX = tuple(n % 12 for n in range(128))
+_OCTAVE = tuple((n // 12) - 1 for n in range(128))
+
+# Names for every MIDI note number, e.g. 60 -> 'C4'
+_NOTE_NAME_TABLE = tuple(f"{NOTE_NAMES[_NAME_IDX[n]]}{_OCTAVE[n]}" for n in range(128))
+
 
 class MidiService(ABC):
     """Abstract base class for MIDI services."""
@@ -48,9 +55,17 @@ class MidiService(ABC):
     @staticmethod
     def note_name(note: int) -> str:
         """Convert MIDI note number to name (e.g., 60 -> 'C4')."""
-        octave = (note // 12) - 1
-        name = NOTE_NAMES[note % 12]
-        return f"{name}{octave}"
+        if 0 <= note < 128:
+            return _NOTE_NAME_TABLE[note]
+        # Outside the MIDI range; compute rather than index the table
+        return f"{NOTE_NAMES[note % 12]}{(note // 12) - 1}"
+
+    @staticmethod
+    def note_parts(note: int) -> tuple[str, int]:
+        """Split MIDI note number into name and octave (e.g., 61 -> ('C#', 4))."""
+        if 0 <= note < 128:
+            return NOTE_NAMES[_NAME_IDX[note]], _OCTAVE[note]
+        return NOTE_NAMES[note % 12], (note // 12) - 1
 
 
 def get_midi_service(use_mock: Optional[bool] = None) -> MidiService:
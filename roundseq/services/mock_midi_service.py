@@ -1,11 +1,14 @@
 """Mock MIDI service for development."""
 from __future__ import annotations
 
+import logging
 from typing import Optional
 
 from .midi_service import MidiService
 from ..config import DEFAULT_VELOCITY, DEFAULT_CHANNEL
 
+_log = logging.getLogger("roundseq.midi")
+
 
 class MockMidiService(MidiService):
     """Mock MIDI service that logs to console."""
@@ -30,13 +33,15 @@ class MockMidiService(MidiService):
 
     def note_on(self, note: int, velocity: int = DEFAULT_VELOCITY) -> None:
         """Log note on message."""
-        name = self.note_name(note)
-        print(f"[MockMIDI] Note ON:  {name} (note={note}, vel={velocity}, ch={self.channel})")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[MockMIDI] Note ON:  %s (note=%d, vel=%d, ch=%d)",
+                       self.note_name(note), note, velocity, self.channel)
 
     def note_off(self, note: int) -> None:
         """Log note off message."""
-        name = self.note_name(note)
-        print(f"[MockMIDI] Note OFF: {name} (note={note}, ch={self.channel})")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[MockMIDI] Note OFF: %s (note=%d, ch=%d)",
+                       self.note_name(note), note, self.channel)
 
     def list_ports(self) -> list[str]:
         """Return fake port list."""
@@ -1,13 +1,23 @@
 """Real MIDI service using python-rtmidi via mido."""
 from __future__ import annotations
 
-from typing import Optional
-
-import mido
+import logging
+from typing import TYPE_CHECKING, Optional
 
 from .midi_service import MidiService
 from ..config import DEFAULT_VELOCITY, DEFAULT_CHANNEL
 
+if TYPE_CHECKING:
+    import mido
+
+_log = logging.getLogger("roundseq.midi")
+
+
+def _check_data_byte(name: str, value: int) -> None:
+    """Reject values mido would reject, for the raw send path."""
+    if not 0 <= value <= 127:
+        raise ValueError(f"{name} must be in range 0..127, got {value}")
+
 
 class RtmidiService(MidiService):
     """MIDI service using mido/rtmidi for real MIDI output."""
@@ -15,6 +25,12 @@ class RtmidiService(MidiService):
     def __init__(self, channel: int = DEFAULT_CHANNEL):
         super().__init__(channel)
         self._port: Optional[mido.ports.BaseOutput] = None
+        # Underlying rtmidi.MidiOut, when the port uses the rtmidi backend
+        self._raw = None
+        # Reusable messages for ports without raw access. Created on connect,
+        # since mido is only imported there to keep this module cheap to load
+        self._msg_on = None
+        self._msg_off = None
 
     def connect(self, port_name: Optional[str] = None) -> bool:
         """Connect to a MIDI output port.
@@ -24,6 +40,9 @@ class RtmidiService(MidiService):
                        preferring hardware ports (pisound) over virtual ones.
         """
         try:
+            import mido
+            self._build_messages()
+
             if port_name:
                 self._port = mido.open_output(port_name)
             else:
@@ -41,6 +60,9 @@ class RtmidiService(MidiService):
                 print(f"[MIDI] Available ports: {ports}")
                 self._port = mido.open_output(selected)
 
+            # Send raw bytes through rtmidi where possible, skipping the
+            # per-note mido.Message allocation and validation
+            self._raw = getattr(self._port, "_rt", None)
             self._connected = True
             print(f"[MIDI] Connected to: {self._port.name}")
             return True
@@ -48,32 +70,59 @@ class RtmidiService(MidiService):
             print(f"[MIDI] Connection failed: {e}")
             return False
 
+    def _build_messages(self) -> None:
+        """Prepare the reusable messages for ports without raw access."""
+        import mido
+        self._msg_on = mido.Message("note_on", channel=self.channel)
+        # mido defaults velocity to 64; note off is sent with 0, matching
+        # the raw path
+        self._msg_off = mido.Message("note_off", channel=self.channel, velocity=0)
+
     def disconnect(self) -> None:
         """Disconnect from the MIDI port."""
         if self._port:
             self._port.close()
             print(f"[MIDI] Disconnected")
             self._port = None
+            self._raw = None
             self._connected = False
 
     def note_on(self, note: int, velocity: int = DEFAULT_VELOCITY) -> None:
         """Send a note on message."""
         if not self._port:
             return
-        msg = mido.Message("note_on", note=note, velocity=velocity, channel=self.channel)
-        self._port.send(msg)
-        name = self.note_name(note)
-        print(f"[MIDI] Note ON:  {name} (note={note}, vel={velocity})")
+        if self._raw is not None:
+            # mido's range checks are skipped here, and a data byte of 0x80
+            # or more would be read as a status byte
+            _check_data_byte("note", note)
+            _check_data_byte("velocity", velocity)
+            self._raw.send_message((0x90 | self.channel, note, velocity))
+        else:
+            msg = self._msg_on
+            msg.channel = self.channel
+            msg.note = note
+            msg.velocity = velocity
+            self._port.send(msg)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[MIDI] Note ON:  %s (note=%d, vel=%d)",
+                       self.note_name(note), note, velocity)
 
     def note_off(self, note: int) -> None:
         """Send a note off message."""
         if not self._port:
             return
-        msg = mido.Message("note_off", note=note, velocity=0, channel=self.channel)
-        self._port.send(msg)
-        name = self.note_name(note)
-        print(f"[MIDI] Note OFF: {name} (note={note})")
+        if self._raw is not None:
+            _check_data_byte("note", note)
+            self._raw.send_message((0x80 | self.channel, note, 0))
+        else:
+            msg = self._msg_off
+            msg.channel = self.channel
+            msg.note = note
+            self._port.send(msg)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[MIDI] Note OFF: %s (note=%d)", self.note_name(note), note)
 
     def list_ports(self) -> list[str]:
         """List available MIDI output ports."""
+        import mido
         return mido.get_output_names()
@@ -5,8 +5,8 @@ from kivy.uix.label import Label
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.properties import NumericProperty, ObjectProperty, StringProperty, BooleanProperty
 from kivy.graphics import Color, Ellipse, Line
-from kivy.clock import Clock
 
+from .deferred_setup import schedule_setup
 from ..geometry import point_in_circle
 from ..config import (
     CENTER_RADIUS,
@@ -27,33 +27,30 @@ class CircleButton(ButtonBehavior, Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._label = None
+        # Create the graphics once; _update only changes their attributes
+        with self.canvas.before:
+            self._bg_color = Color(*COLORS["button_normal"])
+            self._bg_ellipse = Ellipse()
+            Color(0.4, 0.4, 0.45, 1)
+            self._outline = Line(width=1.2)
         self.bind(pos=self._update, size=self._update, is_pressed_state=self._update)
-        Clock.schedule_once(self._setup, 0)
+        schedule_setup(self._setup)
 
     def _setup(self, dt):
         self._update()
 
     def _update(self, *args):
-        self.canvas.before.clear()
-        with self.canvas.before:
-            if self.is_pressed_state:
-                Color(*COLORS["button_pressed"])
-            else:
-                Color(*COLORS["button_normal"])
-            Ellipse(
-                pos=(self.center_x - self.radius, self.center_y - self.radius),
-                size=(self.radius * 2, self.radius * 2),
-            )
-            Color(0.4, 0.4, 0.45, 1)
-            Line(
-                ellipse=(
-                    self.center_x - self.radius,
-                    self.center_y - self.radius,
-                    self.radius * 2,
-                    self.radius * 2,
-                ),
-                width=1.2,
-            )
+        if self.is_pressed_state:
+            self._bg_color.rgba = COLORS["button_pressed"]
+        else:
+            self._bg_color.rgba = COLORS["button_normal"]
+
+        x = self.center_x - self.radius
+        y = self.center_y - self.radius
+        diameter = self.radius * 2
+        self._bg_ellipse.pos = (x, y)
+        self._bg_ellipse.size = (diameter, diameter)
+        self._outline.ellipse = (x, y, diameter, diameter)
 
     def collide_point(self, x, y):
         return point_in_circle(x, y, self.center_x, self.center_y, self.radius)
@@ -75,6 +72,9 @@ class CenterDisplay(Widget):
     # Callbacks
     on_octave_change = ObjectProperty(None)
 
+    # Label text for every reachable octave
+    _OCT_STRINGS = {i: f"OCT {i}" for i in range(MIN_OCTAVE, MAX_OCTAVE + 1)}
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._octave_label = None
@@ -83,34 +83,31 @@ class CenterDisplay(Widget):
         self._btn_down = None
         self._btn_up_label = None
         self._btn_down_label = None
-        self._bg_ellipse = None
         self._setup_done = False
 
-        Clock.schedule_once(self._setup, 0)
+        # Circular background, created once and repositioned in
+        # _update_positions
+        with self.canvas.before:
+            self._bg_color = Color(*COLORS["background"])
+            self._bg_ellipse = Ellipse(
+                pos=(self.center_x - self.radius, self.center_y - self.radius),
+                size=(self.radius * 2, self.radius * 2),
+            )
+
+        schedule_setup(self._setup)
         self.bind(pos=self._update_positions, size=self._update_positions)
 
     def _setup(self, dt):
         """Set up child widgets."""
-        self._draw_background()
         self._create_labels()
         self._create_buttons()
         self._setup_done = True
         self._update_positions()
 
-    def _draw_background(self):
-        """Draw the circular background."""
-        self.canvas.before.clear()
-        with self.canvas.before:
-            Color(*COLORS["background"])
-            self._bg_ellipse = Ellipse(
-                pos=(self.center_x - self.radius, self.center_y - self.radius),
-                size=(self.radius * 2, self.radius * 2),
-            )
-
     def _create_labels(self):
         """Create the octave and note labels."""
         self._octave_label = Label(
-            text=f"OCT {self.octave}",
+            text=self._OCT_STRINGS[self.octave],
             font_size="32sp",
             color=COLORS["text"],
             bold=True,
@@ -162,9 +159,8 @@ class CenterDisplay(Widget):
         cx, cy = self.center_x, self.center_y
 
         # Update background
-        if self._bg_ellipse:
-            self._bg_ellipse.pos = (cx - self.radius, cy - self.radius)
-            self._bg_ellipse.size = (self.radius * 2, self.radius * 2)
+        self._bg_ellipse.pos = (cx - self.radius, cy - self.radius)
+        self._bg_ellipse.size = (self.radius * 2, self.radius * 2)
 
         # Position labels
         if self._octave_label:
@@ -214,7 +210,7 @@ class CenterDisplay(Widget):
     def _update_octave_display(self):
         """Update the octave label."""
         if self._octave_label:
-            self._octave_label.text = f"OCT {self.octave}"
+            self._octave_label.text = self._OCT_STRINGS[self.octave]
 
     def show_note(self, note_name: str):
         """Display the last played note."""
@@ -1,18 +1,18 @@
 """Circular layout for note buttons."""
 
+from kivy.clock import Clock
 from kivy.uix.widget import Widget
 from kivy.properties import (
     NumericProperty,
     ObjectProperty,
     ListProperty,
 )
-from kivy.clock import Clock
 
+from .deferred_setup import schedule_setup
 from .pie_slice_button import PieSliceButton
-from ..geometry import normalize_angle
+from ..layout import NOTE_SECTORS, NoteRingHitTester
 from ..config import (
     NUM_NOTES,
-    NOTE_NAMES,
     INNER_RADIUS,
     OUTER_RADIUS,
     CENTER_X,
@@ -20,8 +20,13 @@ from ..config import (
     DEFAULT_OCTAVE,
 )
 
+# touch.ud key holding the button a touch is currently pressing
+_ACTIVE_KEY = "roundseq_btn"
+# touch.ud key holding the position the touch was last hit tested at
+_POS_KEY = "roundseq_pos"
+
 
-class CircularNoteLayout(Widget):
+class CircularNoteLayout(NoteRingHitTester, Widget):
     """Arranges 12 note buttons in a circular pattern."""
 
     inner_radius = NumericProperty(INNER_RADIUS)
@@ -35,49 +40,45 @@ class CircularNoteLayout(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._note_buttons: list[PieSliceButton] = []
-        # Track active button per touch (supports multitouch)
-        self._active_buttons: dict = {}  # touch.uid -> button
+        # Squared ring radii for hit_test and the buttons' drawn radii,
+        # kept in sync with the radius properties
+        self._update_radii()
+        self.bind(inner_radius=self._update_radii,
+                  outer_radius=self._update_radii)
+        # MIDI note number per note index for the current octave
+        self._midi_notes: list[int] = []
+        self._rebuild_midi_cache()
+        self.bind(octave=self._rebuild_midi_cache)
+        # Center the buttons were last placed at; pos and size changes are
+        # coalesced into one placement per frame
+        self._last_center = None
+        self._trigger_positions = Clock.create_trigger(
+            self._update_button_positions, -1)
+        self.bind(pos=self._trigger_positions, size=self._trigger_positions)
         # Schedule creation after widget is ready
-        Clock.schedule_once(self._create_note_buttons, 0)
+        schedule_setup(self._create_note_buttons)
 
     def _create_note_buttons(self, dt=None):
         """Create the 12 note buttons arranged in a circle."""
         self.clear_widgets()
         self._note_buttons = []
 
-        # Each note gets 30 degrees (360 / 12)
-        angle_per_note = 360 / NUM_NOTES
-
-        for i in range(NUM_NOTES):
-            note_name = NOTE_NAMES[i]
-            is_sharp = "#" in note_name
-
-            # Calculate center angle for this note
-            # C is at top (90 degrees), going clockwise (decreasing angles)
-            center_angle = 90 - (i * angle_per_note)
-
-            # Slice spans half the angle on each side
-            half_angle = angle_per_note / 2
-            start_angle = center_angle - half_angle
-            end_angle = center_angle + half_angle
-
-            # Normalize to 0-360 range
-            start_angle = normalize_angle(start_angle)
-            end_angle = normalize_angle(end_angle)
-
+        # Slice angles are fixed, precomputed in NOTE_SECTORS
+        # (C at top, going clockwise)
+        for sector in NOTE_SECTORS:
             btn = PieSliceButton(
                 inner_radius=self.inner_radius,
                 outer_radius=self.outer_radius,
-                start_angle=start_angle,
-                end_angle=end_angle,
-                label_text=note_name,
-                is_sharp=is_sharp,
+                start_angle=sector.start_angle,
+                end_angle=sector.end_angle,
+                label_text=sector.name,
+                is_sharp="#" in sector.name,
                 size=self.size,
                 pos=self.pos,
             )
 
             # Store note index for MIDI calculation
-            btn.note_index = i
+            btn.note_index = sector.index
 
             # Don't use ButtonBehavior events - we handle touch ourselves
             # for proper slide-between-notes behavior
@@ -85,8 +86,14 @@ class CircularNoteLayout(Widget):
             self._note_buttons.append(btn)
             self.add_widget(btn)
 
+        # New buttons always need placing, even if the center is unchanged
+        self._invalidate_positions()
         self._update_button_positions()
 
+    def _invalidate_positions(self):
+        """Force the next _update_button_positions to place every button."""
+        self._last_center = None
+
     def _update_button_positions(self, *args):
         """Update button center positions based on widget position."""
         if not hasattr(self, '_note_buttons'):
@@ -94,6 +101,9 @@ class CircularNoteLayout(Widget):
 
         cx = self.center_x
         cy = self.center_y
+        if (cx, cy) == self._last_center:
+            return
+        self._last_center = (cx, cy)
 
         for btn in self._note_buttons:
             btn.center_x = cx
@@ -101,36 +111,45 @@ class CircularNoteLayout(Widget):
             # Trigger redraw
             btn._update_graphics()
 
-    def on_pos(self, *args):
-        """Handle position changes."""
-        self._update_button_positions()
+    def _update_radii(self, *args):
+        """Apply a radius change to the hit ring and every button.
 
-    def on_size(self, *args):
-        """Handle size changes."""
-        self._update_button_positions()
+        hit_test uses the layout's ring rather than each button's own
+        geometry, so the drawn slices must follow the same radii.
+        """
+        inner = self.inner_radius
+        outer = self.outer_radius
+        self.set_ring_radii(inner, outer)
+        for btn in self._note_buttons:
+            btn.inner_radius = inner
+            btn.outer_radius = outer
 
     def _find_button_at(self, x, y):
-        """Find which button contains the given point."""
-        for btn in self._note_buttons:
-            if btn.collide_point(x, y):
-                return btn
-        return None
+        """Find which button contains the given point.
 
-    def _activate_button(self, button, touch_uid):
+        Indexes straight into the button list rather than asking each
+        button's collide_point in turn.
+        """
+        index = self.hit_test(x, y)
+        if index < 0 or not self._note_buttons:
+            return None
+        return self._note_buttons[index]
+
+    def _activate_button(self, button, touch):
         """Activate a button (note on)."""
         button.is_pressed_state = True
-        self._active_buttons[touch_uid] = button
+        # The active button rides on the touch itself (supports multitouch)
+        touch.ud[_ACTIVE_KEY] = button
         if self.on_note_on:
-            midi_note = self._get_midi_note(button.note_index)
+            midi_note = self._midi_notes[button.note_index]
             self.on_note_on(midi_note, button.label_text)
 
-    def _deactivate_button(self, button, touch_uid):
+    def _deactivate_button(self, button, touch):
         """Deactivate a button (note off)."""
         button.is_pressed_state = False
-        if touch_uid in self._active_buttons:
-            del self._active_buttons[touch_uid]
+        touch.ud.pop(_ACTIVE_KEY, None)
         if self.on_note_off:
-            midi_note = self._get_midi_note(button.note_index)
+            midi_note = self._midi_notes[button.note_index]
             self.on_note_off(midi_note, button.label_text)
 
     def on_touch_down(self, touch):
@@ -138,7 +157,8 @@ class CircularNoteLayout(Widget):
         button = self._find_button_at(touch.x, touch.y)
         if button:
             touch.grab(self)
-            self._activate_button(button, touch.uid)
+            touch.ud[_POS_KEY] = (touch.x, touch.y)
+            self._activate_button(button, touch)
             return True
         return super().on_touch_down(touch)
 
@@ -147,17 +167,24 @@ class CircularNoteLayout(Widget):
         if touch.grab_current is not self:
             return super().on_touch_move(touch)
 
-        current_button = self._active_buttons.get(touch.uid)
+        # Touch panels also report moves for pressure or contact size
+        # changes; a touch that hasn't moved can't have changed note
+        pos = (touch.x, touch.y)
+        if pos == touch.ud.get(_POS_KEY):
+            return True
+        touch.ud[_POS_KEY] = pos
+
+        current_button = touch.ud.get(_ACTIVE_KEY)
         new_button = self._find_button_at(touch.x, touch.y)
 
         # If we've moved to a different button
         if new_button != current_button:
             # Deactivate old button
             if current_button:
-                self._deactivate_button(current_button, touch.uid)
+                self._deactivate_button(current_button, touch)
             # Activate new button
             if new_button:
-                self._activate_button(new_button, touch.uid)
+                self._activate_button(new_button, touch)
 
         return True
 
@@ -167,9 +194,9 @@ class CircularNoteLayout(Widget):
             return super().on_touch_up(touch)
 
         touch.ungrab(self)
-        current_button = self._active_buttons.get(touch.uid)
+        current_button = touch.ud.get(_ACTIVE_KEY)
         if current_button:
-            self._deactivate_button(current_button, touch.uid)
+            self._deactivate_button(current_button, touch)
 
         return True
 
@@ -180,6 +207,10 @@ class CircularNoteLayout(Widget):
         """
         return (self.octave + 1) * 12 + note_index
 
+    def _rebuild_midi_cache(self, *args):
+        """Recompute the MIDI note numbers after an octave change."""
+        self._midi_notes = [self._get_midi_note(i) for i in range(NUM_NOTES)]
+
     def set_octave(self, octave: int):
         """Set the current octave."""
         self.octave = max(0, min(8, octave))
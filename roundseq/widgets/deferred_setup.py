@@ -0,0 +1,32 @@
+"""Run deferred widget setup in one clock event per frame."""
+
+from kivy.clock import Clock
+
+# Setup callbacks waiting for the next frame, and whether a drain is queued
+_pending_setups = []
+_drain_scheduled = False
+
+
+def schedule_setup(callback):
+    """Call callback(dt) on the next frame.
+
+    Equivalent to Clock.schedule_once(callback, 0), but all widgets created
+    in the same frame share a single clock event instead of one each.
+    """
+    global _drain_scheduled
+    _pending_setups.append(callback)
+    if not _drain_scheduled:
+        _drain_scheduled = True
+        Clock.schedule_once(_drain_setups, 0)
+
+
+def _drain_setups(dt):
+    """Run every pending setup callback."""
+    global _pending_setups, _drain_scheduled
+    pending = _pending_setups
+    # Widgets created by these callbacks are set up on the following frame,
+    # as they would be with their own Clock.schedule_once
+    _pending_setups = []
+    _drain_scheduled = False
+    for callback in pending:
+        callback(dt)
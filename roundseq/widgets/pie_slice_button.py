@@ -1,6 +1,10 @@
 """Pie slice button widget for circular note layout."""
 from __future__ import annotations
 
+import colorsys
+from array import array
+from functools import lru_cache
+
 from kivy.uix.widget import Widget
 from kivy.properties import (
     NumericProperty,
@@ -8,18 +12,87 @@ from kivy.properties import (
     ListProperty,
     BooleanProperty,
 )
+from kivy.clock import Clock
 from kivy.graphics import Color, Line, Mesh
 from kivy.graphics.instructions import InstructionGroup
 
-from ..config import COLORS
+from ..config import COLORS, NUM_NOTES
 from ..geometry import (
     angle_span,
-    polar_to_cartesian,
-    point_in_arc,
-    arc_points,
+    point_in_sector,
+    arc_unit_vectors,
+    arc_sector_flat_from_units,
+)
+
+
+# Debug fill color per note index (hue-based rainbow), computed once
+_DEBUG_COLORS = tuple(
+    colorsys.hsv_to_rgb(i / NUM_NOTES, 0.7, 0.8) + (1,)
+    for i in range(NUM_NOTES)
 )
 
 
+def _generate_slice_geometry(inner_radius: float, outer_radius: float,
+                             start_angle: float,
+                             end_angle: float) -> tuple[array, list, array]:
+    """Generate the mesh and outline for a pie slice centered on (0, 0).
+
+    The mesh is a triangle strip zig-zagging between the inner and outer
+    arcs, so no fan center or closing index is needed. The outline runs
+    along the outer arc forward and the inner arc backward. Both come from
+    the same arc unit vectors, so the trig is evaluated once per angle.
+
+    Returns:
+        (mesh vertices, mesh indices, outline points), with vertices and
+        outline as array('f') so Kivy can copy them in bulk
+    """
+    units = arc_unit_vectors(start_angle, end_angle)
+    n = len(units)
+
+    # Inner then outer point at each angle (texture coords 0, 0)
+    vertices = array("f", bytes(32 * n))
+    for i, (c, s) in enumerate(units):
+        v = 8 * i
+        vertices[v] = inner_radius * c
+        vertices[v + 1] = inner_radius * s
+        vertices[v + 4] = outer_radius * c
+        vertices[v + 5] = outer_radius * s
+
+    outline = arc_sector_flat_from_units(units, 0, 0, inner_radius, outer_radius)
+    indices = list(range(2 * n))
+
+    return vertices, indices, outline
+
+
+@lru_cache(maxsize=64)
+def _slice_template(inner_radius: float, outer_radius: float,
+                    start_angle: float, end_angle: float) -> tuple[array, tuple, array]:
+    """Slice geometry centered on (0, 0), shared by all buttons.
+
+    Returns (mesh vertices, mesh indices, outline points). The returned
+    objects are shared between callers and must not be modified.
+    """
+    vertices, indices, outline = _generate_slice_geometry(
+        inner_radius, outer_radius, start_angle, end_angle)
+    return vertices, tuple(indices), outline
+
+
+def _translated(template: array, dx: float, dy: float, stride: int) -> array:
+    """Copy a flat vertex buffer, offsetting each (x, y) by (dx, dy).
+
+    Args:
+        template: Flat float buffer with x, y at the start of every record
+        dx, dy: Offset to add
+        stride: Number of floats per vertex record
+    """
+    out = array("f", template)
+    # Strided slice assignment keeps the buffer an array('f') throughout
+    # rather than indexing and re-boxing each element
+    out[0::stride] = array("f", [x + dx for x in template[0::stride]])
+    out[1::stride] = array("f", [y + dy for y in template[1::stride]])
+    return out
+
+
 class PieSliceButton(Widget):
     """A button shaped like a pie slice for circular layouts.
 
@@ -49,31 +122,54 @@ class PieSliceButton(Widget):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Squared radii for collide_point, kept in sync with the properties
+        self._inner_r_sq = 0.0
+        self._outer_r_sq = 0.0
+        self._update_radii_sq()
+        self.bind(inner_radius=self._update_radii_sq,
+                  outer_radius=self._update_radii_sq)
+        # Angular span for collide_point, kept in sync the same way
+        self._span = 0.0
+        self._update_span()
+        self.bind(start_angle=self._update_span,
+                  end_angle=self._update_span)
+
+        # Parameters the current mesh/outline were built from; press/color
+        # changes reuse them instead of regenerating the arcs
+        self._geometry_key = None
+
+        # Graphics instructions are created once and updated in place
         self._gfx = InstructionGroup()
+        self._fill_color = Color(*self.background_color)
+        self._mesh = Mesh(mode="triangle_strip")
+        self._outline = Line(width=1.2, close=True)
+        self._gfx.add(self._fill_color)
+        self._gfx.add(self._mesh)
+        self._gfx.add(Color(0.3, 0.3, 0.35, 1))
+        self._gfx.add(self._outline)
         self.canvas.add(self._gfx)
+
+        # Several of these properties change together (e.g. x, y, width and
+        # height on resize); redraw once, just before the next frame
+        self._trigger_redraw = Clock.create_trigger(self._update_graphics, -1)
         self.bind(
-            pos=self._update_graphics,
-            size=self._update_graphics,
-            inner_radius=self._update_graphics,
-            outer_radius=self._update_graphics,
-            start_angle=self._update_graphics,
-            end_angle=self._update_graphics,
-            is_pressed_state=self._update_graphics,
-            is_sharp=self._update_graphics,
+            pos=self._trigger_redraw,
+            size=self._trigger_redraw,
+            inner_radius=self._trigger_redraw,
+            outer_radius=self._trigger_redraw,
+            start_angle=self._trigger_redraw,
+            end_angle=self._trigger_redraw,
+            is_pressed_state=self._trigger_redraw,
+            is_sharp=self._trigger_redraw,
         )
         self._update_graphics()
 
     def _get_debug_color(self):
         """Get a unique color for this note based on index."""
-        import colorsys
-        hue = self.note_index / 12.0
-        r, g, b = colorsys.hsv_to_rgb(hue, 0.7, 0.8)
-        return (r, g, b, 1)
+        return _DEBUG_COLORS[int(self.note_index)]
 
     def _update_graphics(self, *args):
         """Redraw the pie slice."""
-        self._gfx.clear()
-
         # Determine color based on state
         if self.is_pressed_state:
             color = self.pressed_color
@@ -84,95 +180,44 @@ class PieSliceButton(Widget):
         else:
             color = self.background_color
 
-        self._gfx.add(Color(*color))
+        self._fill_color.rgba = color
 
-        # Generate vertices for the pie slice
-        vertices, indices = self._generate_slice_mesh()
-        if vertices and indices:
-            self._gfx.add(
-                Mesh(vertices=vertices, indices=indices, mode="triangle_fan")
-            )
+        self._update_geometry()
 
-        # Draw outline
-        self._gfx.add(Color(0.3, 0.3, 0.35, 1))
-        outline_points = self._generate_outline_points()
-        if len(outline_points) >= 4:
-            self._gfx.add(Line(points=outline_points, width=1.2, close=True))
-
-    def _generate_slice_mesh(self) -> tuple[list, list]:
-        """Generate mesh vertices for the pie slice."""
-        cx = self.center_x
-        cy = self.center_y
-
-        span = angle_span(self.start_angle, self.end_angle)
-        segments = max(8, int(span / 5))
-
-        # Generate arc points using geometry module
-        inner_pts = arc_points(cx, cy, self.inner_radius,
-                               self.start_angle, self.end_angle, segments)
-        outer_pts = arc_points(cx, cy, self.outer_radius,
-                               self.start_angle, self.end_angle, segments)
-
-        # Build triangle fan from center of slice
-        mid_angle = self.start_angle + span / 2
-        mid_radius = (self.inner_radius + self.outer_radius) / 2
-        fan_cx, fan_cy = polar_to_cartesian(cx, cy, mid_radius, mid_angle)
-
-        vertices = []
-        indices = []
-
-        # Add center vertex (texture coords 0, 0)
-        vertices.extend([fan_cx, fan_cy, 0, 0])
-        idx = 0
-
-        # Add outer arc vertices
-        for ox, oy in outer_pts:
-            vertices.extend([ox, oy, 0, 0])
-            idx += 1
-            indices.append(idx)
-
-        # Add inner arc vertices (in reverse for proper winding)
-        for ix, iy in reversed(inner_pts):
-            vertices.extend([ix, iy, 0, 0])
-            idx += 1
-            indices.append(idx)
-
-        # Close the fan
-        indices.append(1)
-
-        # Prepend center index
-        indices = [0] + indices
-
-        return vertices, indices
+    def _update_geometry(self):
+        """Regenerate slice geometry only if its parameters changed."""
+        key = (
+            self.center_x, self.center_y,
+            self.inner_radius, self.outer_radius,
+            self.start_angle, self.end_angle,
+        )
+        if key == self._geometry_key:
+            return
+        self._geometry_key = key
 
-    def _generate_outline_points(self) -> list:
-        """Generate points for the outline."""
+        # The arc shape only depends on radii and angles; moving the
+        # center just translates the cached template
+        vertices, indices, outline = _slice_template(
+            self.inner_radius, self.outer_radius,
+            self.start_angle, self.end_angle,
+        )
         cx = self.center_x
         cy = self.center_y
+        self._mesh.vertices = _translated(vertices, cx, cy, 4)
+        self._mesh.indices = indices
+        self._outline.points = _translated(outline, cx, cy, 2)
 
-        span = angle_span(self.start_angle, self.end_angle)
-        segments = max(8, int(span / 5))
+    def _update_radii_sq(self, *args):
+        """Cache the squared radii used by collide_point."""
+        self._inner_r_sq = self.inner_radius * self.inner_radius
+        self._outer_r_sq = self.outer_radius * self.outer_radius
 
-        # Get arc points
-        outer_pts = arc_points(cx, cy, self.outer_radius,
-                               self.start_angle, self.end_angle, segments)
-        inner_pts = arc_points(cx, cy, self.inner_radius,
-                               self.start_angle, self.end_angle, segments)
-
-        # Flatten to list: outer arc forward, inner arc backward
-        points = []
-        for x, y in outer_pts:
-            points.extend([x, y])
-        for x, y in reversed(inner_pts):
-            points.extend([x, y])
-
-        return points
+    def _update_span(self, *args):
+        """Cache the angular span used by collide_point."""
+        self._span = angle_span(self.start_angle, self.end_angle)
 
     def collide_point(self, x, y):
         """Check if point is within the pie slice."""
-        return point_in_arc(
-            x, y,
-            self.center_x, self.center_y,
-            self.inner_radius, self.outer_radius,
-            self.start_angle, self.end_angle
-        )
+        return point_in_sector(x, y, self.center_x, self.center_y,
+                               self._inner_r_sq, self._outer_r_sq,
+                               self.start_angle, self._span)
@@ -4,39 +4,61 @@
 import math
 import sys
 import os
+from functools import lru_cache
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Configure Kivy before importing
-os.environ['KIVY_LOG_LEVEL'] = 'warning'
+os.environ.setdefault('KIVY_LOG_LEVEL', 'warning')
 from kivy.config import Config
 Config.set("graphics", "width", "1080")
 Config.set("graphics", "height", "1080")
 
-from kivy.base import EventLoop
-
+from roundseq.geometry import angle_from_center
+from roundseq.layout import NOTE_INDEX
 from roundseq.widgets.circular_note_layout import CircularNoteLayout
 from roundseq.config import (
     DISPLAY_WIDTH, DISPLAY_HEIGHT,
-    INNER_RADIUS, OUTER_RADIUS,
     CENTER_X, CENTER_Y,
     NOTE_NAMES,
 )
 
+# Set ROUNDSEQ_QUIET=1 to silence per-note output, e.g. when timing the script
+QUIET = os.environ.get("ROUNDSEQ_QUIET") == "1"
+
 
 class MockTouch:
     """Mock touch event for testing."""
 
     _uid_counter = 0
+    # Released touches, reused by acquire()
+    _pool = []
 
     def __init__(self, x, y):
+        self._reset(x, y)
+
+    def _reset(self, x, y):
         MockTouch._uid_counter += 1
         self.uid = MockTouch._uid_counter
         self.x = x
         self.y = y
+        self.ud = {}
         self.grab_current = None
         self._grabbed = []
 
+    @classmethod
+    def acquire(cls, x, y):
+        """Get a touch at (x, y), reusing a released one if available."""
+        if cls._pool:
+            touch = cls._pool.pop()
+            touch._reset(x, y)
+            return touch
+        return cls(x, y)
+
+    def release(self):
+        """Return this touch to the pool once it is finished with."""
+        MockTouch._pool.append(self)
+
     def grab(self, widget):
         self.grab_current = widget
         self._grabbed.append(widget)
@@ -53,11 +75,15 @@ class MockTouch:
         self.y = y
 
 
-def get_note_position_from_button(button) -> tuple[float, float]:
-    """Get x, y position at the center of a pie slice button."""
-    start = button.start_angle
-    end = button.end_angle
+@lru_cache(maxsize=32)
+def _slice_mid_point(start: float, end: float,
+                     inner_radius: float, outer_radius: float,
+                     cx: float, cy: float) -> tuple[float, float]:
+    """Get the point halfway across a slice, from the slice's own angles.
 
+    Deliberately independent of the layout's note tables, so the tests
+    check that the drawn slice and the hit region agree.
+    """
     # Calculate mid angle, handling wrap-around (e.g., 345 to 15 degrees)
     if end < start:
         # Wrap-around case: e.g., start=345, end=15
@@ -66,15 +92,24 @@ def get_note_position_from_button(button) -> tuple[float, float]:
     else:
         mid_angle = (start + end) / 2
 
-    mid_radius = (button.inner_radius + button.outer_radius) / 2
+    mid_radius = (inner_radius + outer_radius) / 2
     angle_rad = math.radians(mid_angle)
 
-    x = button.center_x + mid_radius * math.cos(angle_rad)
-    y = button.center_y + mid_radius * math.sin(angle_rad)
+    x = cx + mid_radius * math.cos(angle_rad)
+    y = cy + mid_radius * math.sin(angle_rad)
 
     return x, y
 
 
+def get_note_position_from_button(button) -> tuple[float, float]:
+    """Get x, y position at the center of a pie slice button."""
+    return _slice_mid_point(
+        button.start_angle, button.end_angle,
+        button.inner_radius, button.outer_radius,
+        button.center_x, button.center_y,
+    )
+
+
 def test_touch_handling():
     """Test that touches activate the correct buttons."""
     print("\n" + "=" * 60)
@@ -83,14 +118,17 @@ def test_touch_handling():
 
     # Track events
     events = []
+    record = events.append
 
     def on_note_on(midi_note, note_name):
-        events.append(("ON", note_name, midi_note))
-        print(f"  Note ON:  {note_name} (MIDI {midi_note})")
+        record(("ON", note_name, midi_note))
+        if not QUIET:
+            print(f"  Note ON:  {note_name} (MIDI {midi_note})")
 
     def on_note_off(midi_note, note_name):
-        events.append(("OFF", note_name, midi_note))
-        print(f"  Note OFF: {note_name} (MIDI {midi_note})")
+        record(("OFF", note_name, midi_note))
+        if not QUIET:
+            print(f"  Note OFF: {note_name} (MIDI {midi_note})")
 
     # Create the layout
     layout = CircularNoteLayout(
@@ -108,17 +146,16 @@ def test_touch_handling():
     layout.center_y = CENTER_Y
     layout._update_button_positions()
 
-    # Get button references for position calculations
-    buttons = {btn.label_text: btn for btn in layout._note_buttons}
+    # Buttons are created in NOTE_NAMES order, so NOTE_INDEX indexes them
+    buttons = layout._note_buttons
 
     print("\n--- Debug: Button angles ---")
-    for name in NOTE_NAMES:
-        btn = buttons[name]
+    for name, btn in zip(NOTE_NAMES, buttons):
         print(f"  {name:3s}: start={btn.start_angle:6.1f}, end={btn.end_angle:6.1f}")
 
     print("\n--- Test 1: Single click on C (top) ---")
     events.clear()
-    x, y = get_note_position_from_button(buttons["C"])
+    x, y = get_note_position_from_button(buttons[NOTE_INDEX["C"]])
     print(f"  Clicking at ({x:.0f}, {y:.0f})")
 
     touch = MockTouch(x, y)
@@ -132,17 +169,13 @@ def test_touch_handling():
 
     print("\n--- Test 2: Single click on G ---")
     events.clear()
-    g_btn = buttons["G"]
+    g_btn = buttons[NOTE_INDEX["G"]]
     print(f"  G button: start_angle={g_btn.start_angle}, end_angle={g_btn.end_angle}")
     print(f"  G button: center=({g_btn.center_x}, {g_btn.center_y})")
     x, y = get_note_position_from_button(g_btn)
     print(f"  Clicking at ({x:.0f}, {y:.0f})")
     # Debug: check what angle we're clicking
-    dx = x - g_btn.center_x
-    dy = y - g_btn.center_y
-    click_angle = math.degrees(math.atan2(dy, dx))
-    if click_angle < 0:
-        click_angle += 360
+    click_angle = angle_from_center(g_btn.center_x, g_btn.center_y, x, y)
     print(f"  Click angle from center: {click_angle:.1f} degrees")
 
     touch = MockTouch(x, y)
@@ -167,8 +200,8 @@ def test_touch_handling():
 
     print("\n--- Test 4: Slide from C to D ---")
     events.clear()
-    x1, y1 = get_note_position_from_button(buttons["C"])
-    x2, y2 = get_note_position_from_button(buttons["D"])
+    x1, y1 = get_note_position_from_button(buttons[NOTE_INDEX["C"]])
+    x2, y2 = get_note_position_from_button(buttons[NOTE_INDEX["D"]])
     print(f"  Touch down at C ({x1:.0f}, {y1:.0f})")
     print(f"  Slide to D ({x2:.0f}, {y2:.0f})")
 
@@ -191,9 +224,9 @@ def test_touch_handling():
 
     print("\n--- Test 5: Slide through C -> C# -> D ---")
     events.clear()
-    x1, y1 = get_note_position_from_button(buttons["C"])
-    x2, y2 = get_note_position_from_button(buttons["C#"])
-    x3, y3 = get_note_position_from_button(buttons["D"])
+    x1, y1 = get_note_position_from_button(buttons[NOTE_INDEX["C"]])
+    x2, y2 = get_note_position_from_button(buttons[NOTE_INDEX["C#"]])
+    x3, y3 = get_note_position_from_button(buttons[NOTE_INDEX["D"]])
 
     touch = MockTouch(x1, y1)
     layout.on_touch_down(touch)
@@ -223,14 +256,17 @@ def test_touch_handling():
     print("  PASSED")
 
     print("\n--- Test 6: Verify all 12 notes are clickable ---")
-    for note_name in NOTE_NAMES:
+    positions = [get_note_position_from_button(btn) for btn in buttons]
+    assert layout.hit_test_many(positions) == list(range(len(buttons))), \
+        "Batched hit test disagrees with note order"
+
+    for note_name, (x, y) in zip(NOTE_NAMES, positions):
         events.clear()
-        btn = buttons[note_name]
-        x, y = get_note_position_from_button(btn)
 
-        touch = MockTouch(x, y)
+        touch = MockTouch.acquire(x, y)
         layout.on_touch_down(touch)
         layout.on_touch_up(touch)
+        touch.release()
 
         if len(events) != 2:
             print(f"  FAILED: {note_name} at ({x:.0f}, {y:.0f}) - got {len(events)} events")
@@ -10,11 +10,16 @@ from roundseq.geometry import (
     angle_contains,
     polar_to_cartesian,
     cartesian_to_polar,
+    angle_from_center,
     point_in_circle,
     point_in_ring,
     point_in_arc,
+    point_in_sector,
     arc_points,
     arc_sector_points,
+    arc_sector_flat,
+    arc_sector_flat_from_units,
+    arc_unit_vectors,
 )
 
 
@@ -35,6 +40,15 @@ class TestNormalizeAngle:
         assert normalize_angle(450) == 90
         assert normalize_angle(720) == 0
 
+    def test_fractional_angles(self):
+        assert normalize_angle(-0.5) == pytest.approx(359.5)
+        assert normalize_angle(1080.25) == pytest.approx(0.25)
+
+    def test_tiny_negative_stays_below_360(self):
+        # -1e-20 + 360 rounds to exactly 360.0
+        assert normalize_angle(-1e-20) == 0
+        assert normalize_angle(-720 - 1e-13) < 360
+
 
 class TestAngleSpan:
     def test_simple_span(self):
@@ -55,6 +69,11 @@ class TestAngleSpan:
         # 10 to 350 going the "long way" = 340 degrees
         assert angle_span(10, 350) == 340
 
+    def test_unnormalized_inputs(self):
+        assert angle_span(-15, 15) == 30
+        assert angle_span(345, 375) == 30
+        assert angle_span(720, 90) == 90
+
 
 class TestAngleContains:
     def test_simple_range(self):
@@ -75,6 +94,16 @@ class TestAngleContains:
         assert angle_contains(0, 350, 10) is True
         assert angle_contains(360, 350, 10) is True  # 360 normalizes to 0
 
+    def test_unnormalized_inputs(self):
+        assert angle_contains(-10, 345, 15) is True
+        assert angle_contains(5, -15, 15) is True
+        assert angle_contains(725, 0, 10) is True
+        assert angle_contains(-30, 0, 90) is False
+
+    def test_just_below_start_rounds_to_start(self):
+        # (-1e-20 - 0) % 360 rounds to 360.0
+        assert angle_contains(-1e-20, 0, 90) is True
+
 
 class TestPolarToCartesian:
     def test_cardinal_directions(self):
@@ -139,6 +168,21 @@ class TestCartesianToPolar:
         assert dist == 0
 
 
+class TestAngleFromCenter:
+    def test_cardinal_directions(self):
+        assert angle_from_center(100, 100, 150, 100) == pytest.approx(0)
+        assert angle_from_center(100, 100, 100, 150) == pytest.approx(90)
+        assert angle_from_center(100, 100, 50, 100) == pytest.approx(180)
+        assert angle_from_center(100, 100, 100, 50) == pytest.approx(270)
+
+    def test_matches_cartesian_to_polar(self):
+        _, expected = cartesian_to_polar(100, 100, 37, 181)
+        assert angle_from_center(100, 100, 37, 181) == pytest.approx(expected)
+
+    def test_just_below_axis_stays_below_360(self):
+        assert angle_from_center(0, 0, 1, -1e-300) < 360
+
+
 class TestPointInCircle:
     def test_inside(self):
         assert point_in_circle(100, 100, 100, 100, 50) is True  # Center
@@ -205,6 +249,31 @@ class TestPointInArc:
         assert point_in_arc(x, y, cx, cy, 30, 50, 345, 15) is False
 
 
+class TestPointInSector:
+    def test_matches_point_in_arc(self):
+        cx, cy = 100, 100
+        for start, end in ((45, 135), (345, 15)):
+            span = angle_span(start, end)
+            for angle in range(0, 360, 5):
+                for r in (20, 30, 40, 50, 60):
+                    x, y = polar_to_cartesian(cx, cy, r, angle)
+                    expected = point_in_arc(x, y, cx, cy, 30, 50, start, end)
+                    assert point_in_sector(x, y, cx, cy, 30 * 30, 50 * 50,
+                                           start, span) is expected
+
+
+class TestArcUnitVectors:
+    def test_default_segments(self):
+        # Roughly one segment per 5 degrees, minimum 8
+        assert len(arc_unit_vectors(0, 30)) == 9
+        assert len(arc_unit_vectors(0, 90)) == 19
+
+    def test_endpoints(self):
+        units = arc_unit_vectors(345, 15, segments=6)
+        assert units[0][0] == pytest.approx(math.cos(math.radians(345)))
+        assert units[-1][1] == pytest.approx(math.sin(math.radians(15)))
+
+
 class TestArcPoints:
     def test_generates_points(self):
         points = arc_points(100, 100, 50, 0, 90, segments=4)
@@ -247,3 +316,34 @@ class TestArcSectorPoints:
 
         # Last point: inner arc at 0 degrees
         assert points[-1][0] == pytest.approx(130)  # cx + inner_r
+
+    def test_matches_individual_arcs(self):
+        points = arc_sector_points(100, 100, 30, 50, 345, 15, segments=6)
+        outer = arc_points(100, 100, 50, 345, 15, segments=6)
+        inner = arc_points(100, 100, 30, 345, 15, segments=6)
+
+        expected = outer + inner[::-1]
+        assert len(points) == len(expected)
+        for (x, y), (ex, ey) in zip(points, expected):
+            assert x == pytest.approx(ex)
+            assert y == pytest.approx(ey)
+
+
+class TestArcSectorFlat:
+    def test_matches_arc_sector_points(self):
+        flat = arc_sector_flat(540, 540, 297, 513, 75, 105, segments=8)
+        points = arc_sector_points(540, 540, 297, 513, 75, 105, segments=8)
+
+        assert len(flat) == 2 * len(points)
+        for i, (x, y) in enumerate(points):
+            assert flat[2 * i] == pytest.approx(x, abs=1e-3)
+            assert flat[2 * i + 1] == pytest.approx(y, abs=1e-3)
+
+    def test_is_float_array(self):
+        flat = arc_sector_flat(100, 100, 30, 50, 0, 90, segments=2)
+        assert flat.typecode == "f"
+
+    def test_from_units_matches(self):
+        units = arc_unit_vectors(345, 15, segments=6)
+        flat = arc_sector_flat_from_units(units, 100, 100, 30, 50)
+        assert flat == arc_sector_flat(100, 100, 30, 50, 345, 15, segments=6)
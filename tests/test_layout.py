@@ -0,0 +1,123 @@
+"""Unit tests for the static note layout tables."""
+from __future__ import annotations
+
+import pytest
+
+from roundseq.config import (
+    NUM_NOTES,
+    NOTE_NAMES,
+    CENTER_X,
+    CENTER_Y,
+    INNER_RADIUS,
+    OUTER_RADIUS,
+)
+from roundseq.geometry import polar_to_cartesian, point_in_arc, angle_from_center
+from roundseq.layout import (
+    NOTE_CENTER_ANGLES,
+    NOTE_SECTORS,
+    NOTE_INDEX,
+    NoteRingHitTester,
+    note_index_from_offset,
+)
+
+# Radius halfway across the note ring, and each slice's center there
+MID_RADIUS = (INNER_RADIUS + OUTER_RADIUS) / 2
+SLICE_CENTERS = [
+    polar_to_cartesian(CENTER_X, CENTER_Y, MID_RADIUS, angle)
+    for angle in NOTE_CENTER_ANGLES
+]
+
+
+class TestNoteCenterAngles:
+    def test_c_is_at_top(self):
+        assert NOTE_CENTER_ANGLES[0] == 90
+
+    def test_clockwise_order(self):
+        # D (index 2) is 60 degrees clockwise from C
+        assert NOTE_CENTER_ANGLES[2] == 30
+
+
+class TestNoteSectors:
+    def test_note_index_matches_sector_order(self):
+        for sector in NOTE_SECTORS:
+            assert NOTE_INDEX[sector.name] == sector.index
+
+    def test_one_sector_per_note(self):
+        assert len(NOTE_SECTORS) == NUM_NOTES
+        assert [s.name for s in NOTE_SECTORS] == NOTE_NAMES
+        assert [s.index for s in NOTE_SECTORS] == list(range(NUM_NOTES))
+
+    def test_c_centered_at_top(self):
+        c = NOTE_SECTORS[0]
+        assert c.start_angle == pytest.approx(75)
+        assert c.end_angle == pytest.approx(105)
+
+    def test_wrap_around_sector(self):
+        # D# is centered on 0 degrees, so its slice wraps through 0
+        d_sharp = NOTE_SECTORS[3]
+        assert d_sharp.start_angle == pytest.approx(345)
+        assert d_sharp.end_angle == pytest.approx(15)
+        assert d_sharp.span == pytest.approx(30)
+
+    def test_sectors_are_contiguous_clockwise(self):
+        for prev, sector in zip(NOTE_SECTORS, NOTE_SECTORS[1:]):
+            assert sector.end_angle == pytest.approx(prev.start_angle)
+            assert sector.span == pytest.approx(360 / NUM_NOTES)
+
+
+class TestNoteIndexFromOffset:
+    def test_note_centers(self):
+        for i in range(NUM_NOTES):
+            x, y = polar_to_cartesian(0, 0, 100, NOTE_CENTER_ANGLES[i])
+            assert note_index_from_offset(x, y) == i
+
+    def test_cardinal_directions(self):
+        assert note_index_from_offset(0, 1) == 0  # Up: C
+        assert note_index_from_offset(1, 0) == 3  # Right: D#
+        assert note_index_from_offset(0, -1) == 6  # Down: F#
+        assert note_index_from_offset(-1, 0) == 9  # Left: A
+
+    def test_matches_point_in_arc_over_display(self):
+        boundaries = [s.start_angle for s in NOTE_SECTORS]
+        for x in range(0, 1080, 7):
+            for y in range(0, 1080, 7):
+                angle = angle_from_center(CENTER_X, CENTER_Y, x, y)
+                if any(abs((angle - b + 180) % 360 - 180) < 1e-6 for b in boundaries):
+                    continue  # Either neighbour is acceptable on a boundary
+                expected = [
+                    s.index for s in NOTE_SECTORS
+                    if point_in_arc(x, y, CENTER_X, CENTER_Y,
+                                    INNER_RADIUS, OUTER_RADIUS,
+                                    s.start_angle, s.end_angle)
+                ]
+                if not expected:
+                    continue  # Outside the ring
+                assert note_index_from_offset(x - CENTER_X, y - CENTER_Y) == expected[0]
+
+
+class _Ring(NoteRingHitTester):
+    center_x = CENTER_X
+    center_y = CENTER_Y
+
+
+class TestNoteRingHitTester:
+    def test_note_centers(self):
+        ring = _Ring()
+        for i, (x, y) in enumerate(SLICE_CENTERS):
+            assert ring.hit_test(x, y) == i
+
+    def test_outside_ring(self):
+        ring = _Ring()
+        assert ring.hit_test(CENTER_X, CENTER_Y) == -1
+        assert ring.hit_test(CENTER_X, CENTER_Y + OUTER_RADIUS + 1) == -1
+
+    def test_set_ring_radii(self):
+        ring = _Ring()
+        ring.set_ring_radii(10, 20)
+        assert ring.hit_test(CENTER_X, CENTER_Y + 15) == 0
+        assert ring.hit_test(CENTER_X, CENTER_Y + MID_RADIUS) == -1
+
+    def test_hit_test_many_matches_hit_test(self):
+        ring = _Ring()
+        points = list(SLICE_CENTERS) + [(CENTER_X, CENTER_Y), (0, 0)]
+        assert ring.hit_test_many(points) == [ring.hit_test(x, y) for x, y in points]
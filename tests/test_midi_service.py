@@ -0,0 +1,109 @@
+"""Unit tests for MIDI service helpers."""
+from __future__ import annotations
+
+import pytest
+
+from roundseq.services.midi_service import MidiService
+from roundseq.services.rtmidi_service import RtmidiService
+
+
+class TestNoteName:
+    def test_middle_c(self):
+        assert MidiService.note_name(60) == "C4"
+
+    def test_sharps(self):
+        assert MidiService.note_name(61) == "C#4"
+        assert MidiService.note_name(70) == "A#4"
+
+    def test_range_limits(self):
+        assert MidiService.note_name(0) == "C-1"
+        assert MidiService.note_name(127) == "G9"
+
+    def test_outside_midi_range(self):
+        assert MidiService.note_name(-1) == "B-2"
+        assert MidiService.note_name(128) == "G#9"
+
+
+class TestNoteParts:
+    def test_middle_c(self):
+        assert MidiService.note_parts(60) == ("C", 4)
+
+    def test_matches_note_name(self):
+        for note in range(128):
+            name, octave = MidiService.note_parts(note)
+            assert f"{name}{octave}" == MidiService.note_name(note)
+
+    def test_outside_midi_range(self):
+        assert MidiService.note_parts(-1) == ("B", -2)
+        assert MidiService.note_parts(128) == ("G#", 9)
+
+
+class _RecordingPort:
+    name = "test"
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, msg):
+        self.sent.append(msg.copy())
+
+
+class TestRtmidiMessages:
+    def test_note_off_velocity_is_zero(self):
+        pytest.importorskip("mido")
+        service = RtmidiService()
+        service._build_messages()
+        service._port = _RecordingPort()
+
+        service.note_on(60, 100)
+        service.note_off(60)
+
+        note_off = service._port.sent[-1]
+        assert note_off.type == "note_off"
+        assert note_off.note == 60
+        assert note_off.velocity == 0
+
+
+class _RecordingRtMidi:
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, message):
+        self.sent.append(tuple(message))
+
+
+class _RawPort:
+    name = "test"
+
+    def __init__(self):
+        self._rt = _RecordingRtMidi()
+
+
+class TestRtmidiRawPath:
+    def _service(self, channel=0):
+        service = RtmidiService(channel)
+        service._port = _RawPort()
+        service._raw = service._port._rt
+        return service
+
+    def test_note_bytes(self):
+        service = self._service(channel=2)
+        service.note_on(60, 100)
+        service.note_off(60)
+        assert service._raw.sent == [(0x92, 60, 100), (0x82, 60, 0)]
+
+    def test_channel_change_after_connect(self):
+        service = self._service(channel=0)
+        service.channel = 5
+        service.note_on(64, 90)
+        assert service._raw.sent == [(0x95, 64, 90)]
+
+    def test_rejects_out_of_range_data(self):
+        service = self._service()
+        with pytest.raises(ValueError):
+            service.note_on(128, 100)
+        with pytest.raises(ValueError):
+            service.note_on(60, 128)
+        with pytest.raises(ValueError):
+            service.note_off(-1)
+        assert service._raw.sent == []
@@ -1,3 +1,5 @@
+from collections import deque
+
 from kivy.app import App
 from kivy.uix.label import Label
 
@@ -5,13 +7,21 @@ from kivy.uix.label import Label
 class TestApp(App):
     def build(self):
         self.label = Label(text='Touch me!', font_size=50)
+        # App doesn't receive touches; the root label does
+        self.label.bind(on_touch_down=self._on_label_touch)
+        # Recent touches, printed on exit rather than on every event
+        self.touches = deque(maxlen=32)
         return self.label
 
-    def on_touch_down(self, touch):
-        self.label.text = f'Touch: {touch.x:.0f}, {touch.y:.0f}'
-        print(f'Touch: {touch.x}, {touch.y}')
+    def _on_label_touch(self, label, touch):
+        label.text = f'Touch: {touch.x:.0f}, {touch.y:.0f}'
+        self.touches.append((touch.x, touch.y))
         return True
 
+    def on_stop(self):
+        for x, y in self.touches:
+            print(f'Touch: {x}, {y}')
+
 
 if __name__ == '__main__':
     TestApp().run()